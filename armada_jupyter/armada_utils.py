@@ -12,7 +12,7 @@ from armada_client.client import ArmadaClient
 from armada_client.event import Event
 from armada_client.typings import EventType
 
-from armada_jupyter.constants import TERMINAL_EVENTS
+from armada_jupyter.constants import QUEUED_EVENTS, TERMINAL_EVENTS
 from armada_jupyter.submissions import Job, Submission
 
 
@@ -107,10 +107,7 @@ def check_job_status(client: ArmadaClient, submission: Submission, job_id: str)
                     # If queued or pending
                     # Note: In theory this could just be pending, but incase that event
                     # is missed, we also check for queued.
-                    if (
-                        event.type == EventType.queued
-                        or event.type == EventType.pending
-                    ):
+                    if event.type in QUEUED_EVENTS:
                         print("Job is Queued")
                         if not submission.wait_for_jobs_running:
                             return True
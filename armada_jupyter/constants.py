@@ -35,3 +35,8 @@ TERMINAL_EVENTS = [
     EventType.cancelled,
     EventType.succeeded,
 ]
+
+QUEUED_EVENTS = [
+    EventType.queued,
+    EventType.pending,
+]
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from armada_client.k8s.io.api.core.v1 import generated_pb2 as core_v1
 from armada_client.k8s.io.apimachinery.pkg.api.resource import (
     generated_pb2 as api_resource,
@@ -11,6 +13,18 @@ ResourceRequirements = core_v1.ResourceRequirements
 Quantity = api_resource.Quantity
 
 
+@lru_cache(maxsize=256)
+def _quantity(value: str) -> api_resource.Quantity:
+    """
+    Returns a shared Quantity for the given value.
+
+    This is safe because protobuf copies message values into the map
+    fields of ResourceRequirements, so the cached object is never mutated.
+    """
+
+    return Quantity(string=value)
+
+
 def create_podspec_object(podspec_dict: dict) -> core_v1.PodSpec:
     """
     Creates a PodSpec object from a dictionary.
@@ -18,20 +32,8 @@ def create_podspec_object(podspec_dict: dict) -> core_v1.PodSpec:
     Ensures that the correct types are used for the PodSpec object.
     """
 
-    for container in podspec_dict["containers"]:
-        if "resources" in container:
-
-            if "limits" in container["resources"]:
-                container["resources"]["limits"] = {
-                    key: Quantity(string=str(value))
-                    for key, value in container["resources"]["limits"].items()
-                }
-
-            if "requests" in container["resources"]:
-                container["resources"]["requests"] = {
-                    key: Quantity(string=str(value))
-                    for key, value in container["resources"]["requests"].items()
-                }
+    if "containers" not in podspec_dict:
+        raise ValueError("Please specify a container in your podspec.")
 
     # check that length of containers is exactly 1
     # if not, raise an error
@@ -40,16 +42,26 @@ def create_podspec_object(podspec_dict: dict) -> core_v1.PodSpec:
             "Only one container per pod is supported. Please check your podspec."
         )
 
-    if "containers" not in podspec_dict:
-        raise ValueError("Please specify a container in your podspec.")
+    container = podspec_dict["containers"][0]
 
-    if "ports" not in podspec_dict["containers"][0]:
+    if "ports" not in container:
         raise ValueError("Please specify a port in your podspec.")
 
-    if "containerPort" not in podspec_dict["containers"][0]["ports"][0]:
+    if "containerPort" not in container["ports"][0]:
         raise ValueError("Please specify a containerPort in your podspec.")
 
-    if "name" not in podspec_dict["containers"][0]:
+    if "name" not in container:
         raise ValueError("Please specify a name for the containers in your podspec.")
 
+    resources = container.get("resources")
+
+    if resources:
+        # limits and requests share the same layout, so convert both
+        # in a single pass over the resources block
+        for kind in ("limits", "requests"):
+            if kind in resources:
+                resources[kind] = {
+                    key: _quantity(str(value)) for key, value in resources[kind].items()
+                }
+
     return core_v1.PodSpec(**podspec_dict)
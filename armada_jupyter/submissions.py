@@ -1,16 +1,36 @@
-from typing import List, Dict
+from typing import Any, Dict, List
 
 import yaml
 from armada_client.armada.submit_pb2 import IngressConfig, ServiceConfig
 from armada_jupyter.podspec import create_podspec_object, PodSpec
 from armada_jupyter.constants import YMLSTR
 
+# Use the libyaml backed loader where available, it is significantly
+# faster than the pure python implementation.
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# yml keys in an ingress config that are named differently in the protobuf
+INGRESS_PROTOBUF_KEYS = {
+    "tlsEnabled": "tls_enabled",
+    "useClusterIP": "use_clusterIP",
+}
+
 
 class Job:
     """
     Represents a job to be submitted to Armada.
     """
 
+    __slots__ = (
+        "podspec",
+        "priority",
+        "namespace",
+        "ingress",
+        "services",
+        "labels",
+        "annotations",
+    )
+
     def __init__(
         self,
         podspec: PodSpec,
@@ -30,9 +50,11 @@ class Job:
         self.annotations = annotations
 
     def __repr__(self) -> str:
+        # podspec is left out as protobuf text formatting is expensive
         return (
-            f"Jobs({self.podspec}, {self.priority}, {self.namespace}, "
-            f"{self.ingress}, {self.services})"
+            f"Job(priority={self.priority}, namespace={self.namespace}, "
+            f"#ingress={len(self.ingress or ())}, "
+            f"#services={len(self.services or ())})"
         )
 
 
@@ -41,6 +63,8 @@ class Submission:
     Represents a Armada-Jupyter Submission
     """
 
+    __slots__ = ("queue", "job_set_id", "wait_for_jobs_running", "jobs")
+
     def __init__(
         self, queue: str, job_set_id: str, wait_for_jobs_running: bool, jobs: List[Job]
     ):
@@ -52,57 +76,52 @@ class Submission:
     def __repr__(self) -> str:
         return (
             f"Submission(queue={self.queue}, job_set_id={self.job_set_id}, "
-            f"jobs={self.jobs})"
+            f"jobs=[{len(self.jobs)} jobs])"
         )
 
 
-def convert_to_submission(file: str) -> Submission:
+def _job_from_dict(job: Any) -> Job:
     """
-    Converts a yaml file into a Submission object
+    Converts a single entry of the jobs list into a Job object
     """
 
-    with open(file, "r", encoding="utf-8") as stream:
-        data = yaml.safe_load(stream)
-
-    jobs = []
-
-    for job in data["jobs"]:
-        podspec = job.get(YMLSTR.PODSPEC)
-        priority = job.get(YMLSTR.PRIORITY)
-        namespace = job.get(YMLSTR.NAMESPACE)
-        ingress = job.get(YMLSTR.INGRESS)
-        services = job.get(YMLSTR.SERVICES)
-        labels = job.get(YMLSTR.LABELS)
-        annotations = job.get(YMLSTR.ANNOTATIONS)
-
-        podspec = create_podspec_object(podspec)
-
-        ingress_configs = []
+    # bind the lookup once, it is used for every key below
+    get = job.get
+
+    podspec = create_podspec_object(get(YMLSTR.PODSPEC))
+
+    # change ingress key names to match protobuf
+    ingress_configs = [
+        IngressConfig(**remap_ingress_protobuf_keys(i_config))
+        for i_config in (get(YMLSTR.INGRESS) or ())
+    ]
+    service_configs = [
+        ServiceConfig(**s_config) for s_config in (get(YMLSTR.SERVICES) or ())
+    ]
+
+    return Job(
+        podspec,
+        get(YMLSTR.PRIORITY),
+        get(YMLSTR.NAMESPACE),
+        ingress_configs,
+        service_configs,
+        get(YMLSTR.LABELS),
+        get(YMLSTR.ANNOTATIONS),
+    )
 
-        if ingress is not None:
-            for i_config in ingress:
-                # change key names to match protobuf
-                remap_ingress_protobuf_keys(i_config)
 
-                ingress_configs.append(IngressConfig(**i_config))
+def convert_to_submission(file: str) -> Submission:
+    """
+    Converts a yaml file into a Submission object
+    """
 
-        service_configs = []
+    # Read the whole file up front so the loader scans one contiguous buffer
+    with open(file, "rb") as stream:
+        buf = stream.read()
 
-        if services is not None:
-            for s_config in services:
-                service_configs.append(ServiceConfig(**s_config))
+    data = yaml.load(buf, Loader=Loader)
 
-        jobs.append(
-            Job(
-                podspec,
-                priority,
-                namespace,
-                ingress_configs,
-                service_configs,
-                labels,
-                annotations,
-            )
-        )
+    jobs = [_job_from_dict(job) for job in data[YMLSTR.JOBS]]
 
     return Submission(
         data[YMLSTR.QUEUE],
@@ -112,13 +131,9 @@ def convert_to_submission(file: str) -> Submission:
     )
 
 
-def remap_ingress_protobuf_keys(config: Dict[str, str]):
+def remap_ingress_protobuf_keys(config: Dict[str, Any]) -> Dict[str, Any]:
     """
     Remap keys in ingress config to match protobuf
     """
 
-    if "tlsEnabled" in config:
-        config["tls_enabled"] = config.pop("tlsEnabled")
-
-    if "useClusterIP" in config:
-        config["use_clusterIP"] = config.pop("useClusterIP")
+    return {INGRESS_PROTOBUF_KEYS.get(key, key): value for key, value in config.items()}
@@ -2,9 +2,11 @@
 Testing the submit function in __main__.py
 """
 
+import copy
 import os
 
 import pytest
+import yaml
 from typer.testing import CliRunner
 
 from armada_jupyter.__main__ import app, submit_worker
@@ -52,3 +54,25 @@ def test_app():
     assert result.exit_code == 1, result.stdout
     assert "Getting Submission Objects" in result.stdout, result.stdout
     assert file in result.stdout, result.stdout
+
+
+def test_submit_validates_all_jobs(tmp_path, fake_armada_client, capsys):
+    """
+    An invalid job should fail before any job is submitted
+    """
+
+    with open(TEST_FILE, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+
+    invalid_job = copy.deepcopy(data["jobs"][0])
+    del invalid_job["podSpec"]["containers"][0]["name"]
+    data["jobs"].append(invalid_job)
+
+    file = tmp_path / "invalid.yml"
+    file.write_text(yaml.safe_dump(data))
+
+    with pytest.raises(ValueError):
+        submit_worker(str(file), fake_armada_client)
+
+    captured = capsys.readouterr()
+    assert "Submitted Job" not in captured.out, captured.out
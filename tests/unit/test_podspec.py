@@ -1,7 +1,7 @@
 import pytest
 import yaml
 
-from armada_jupyter.podspec import create_podspec_object
+from armada_jupyter.podspec import _quantity, create_podspec_object
 
 
 @pytest.mark.parametrize(
@@ -51,3 +51,46 @@ def test_get_podspec(file, fake_podspec, request):
         podspec.containers[0].resources.limits["nvidia.com/gpu"].string
         == fake_podspec.containers[0].resources.limits["nvidia.com/gpu"].string
     )
+
+
+def test_quantities_not_shared():
+    with open("tests/files/general.yml", "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+
+    podspec = create_podspec_object(data["jobs"][0]["podSpec"])
+    podspec.containers[0].resources.limits["cpu"].string = "2"
+
+    # The cached Quantity must not be affected by changes to a podspec
+    assert podspec.containers[0].resources.requests["cpu"].string == "1"
+    assert _quantity("1").string == "1"
+
+
+@pytest.mark.parametrize(
+    "podspec_dict",
+    [
+        {},
+        {"containers": []},
+        {"containers": [{"name": "jupyterlab"}]},
+    ],
+)
+def test_invalid_podspec(podspec_dict):
+    with pytest.raises(ValueError):
+        create_podspec_object(podspec_dict)
+
+
+def test_requests_converted_separately():
+    podspec = create_podspec_object(
+        {
+            "containers": [
+                {
+                    "name": "jupyterlab",
+                    "ports": [{"containerPort": 8888}],
+                    "resources": {"limits": {"cpu": 1}, "requests": {"cpu": 1.0}},
+                }
+            ]
+        }
+    )
+
+    # 1 == 1.0, but each side should keep its own string form
+    assert podspec.containers[0].resources.limits["cpu"].string == "1"
+    assert podspec.containers[0].resources.requests["cpu"].string == "1.0"